@@ -1,9 +1,15 @@
-from .expression_parser import ExpressionParser
-from .function import Function
-from .interpolated_table import InterpolatedTable
-from .parsers import parse_bpx_file, parse_bpx_obj, parse_bpx_str
-from .schema import BPX, check_sto_limits
-from .utilities import get_electrode_concentrations, get_electrode_stoichiometries
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .expression_parser import ExpressionParser
+    from .function import Function
+    from .interpolated_table import InterpolatedTable
+    from .parsers import parse_bpx_file, parse_bpx_obj, parse_bpx_str
+    from .schema import BPX, check_sto_limits
+    from .utilities import get_electrode_concentrations, get_electrode_stoichiometries
 
 __version__ = "0.5.0"
 
@@ -19,3 +25,48 @@ __all__ = [
     "parse_bpx_obj",
     "parse_bpx_str",
 ]
+
+# Submodule defining each public name; they are imported on first access so that
+# importing bpx does not build the pydantic models
+_SUBMODULES = {
+    "BPX": "schema",
+    "ExpressionParser": "expression_parser",
+    "Function": "function",
+    "InterpolatedTable": "interpolated_table",
+    "check_sto_limits": "schema",
+    "get_electrode_concentrations": "utilities",
+    "get_electrode_stoichiometries": "utilities",
+    "parse_bpx_file": "parsers",
+    "parse_bpx_obj": "parsers",
+    "parse_bpx_str": "parsers",
+}
+
+
+# Submodules of bpx, which were all imported by `import bpx` before the public names
+# became lazy; they are still available as attributes and are imported on first access
+_SUBMODULE_NAMES = (
+    "base_extra_model",
+    "expression_parser",
+    "function",
+    "interpolated_table",
+    "parsers",
+    "schema",
+    "utilities",
+    "validators",
+)
+
+
+def __getattr__(name: str) -> object:
+    if name in _SUBMODULES:
+        value = getattr(import_module(f".{_SUBMODULES[name]}", __name__), name)
+    elif name in _SUBMODULE_NAMES:
+        value = import_module(f".{name}", __name__)
+    else:
+        error_msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(error_msg)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*__all__, "__version__", *_SUBMODULE_NAMES})
@@ -1,67 +1,158 @@
-# based on fourFn.py example from pyparsing
+# The grammar and the layout of the expression stack follow the fourFn.py
+# example from pyparsing
 # (https://github.com/pyparsing/pyparsing/blob/master/examples/fourFn.py)
 # Copyright 2003-2019 by Paul McGuire
 #
 
-import pyparsing as pp
-import pyparsing.common as ppc
+from __future__ import annotations
 
+import re
 
-class ExpressionParser:
-    """
-    An expression parser for mathematical expressions. For valid expressions,
-    please see :class:`bpx.Function`.
-    """
+_TOKEN_RE = re.compile(
+    r"[ \t\r\n]*(?:"
+    r"(?P<number>(?:\d+\.\d*|\.\d+|\d+)(?:[eE][-+]?\d+)?)"
+    r"|(?P<op>\*\*|[-+*/(),])"
+    r"|(?P<ident>[A-Za-z][A-Za-z0-9]*)"
+    r"|(?P<end>\Z)"
+    r")",
+)
 
-    ParseException = pp.ParseException
 
-    def __init__(self) -> None:
-        fnumber = ppc.number()
-        ident = pp.Literal("x")
-
-        fn_ident = pp.Word(pp.alphas, pp.alphanums)
-        plus, minus, mult, div = map(pp.Literal, "+-*/")
-        lpar, rpar = map(pp.Suppress, "()")
-        addop = plus | minus
-        multop = mult | div
-        expop = pp.Literal("**")
-
-        expr = pp.Forward()
+class ParseException(Exception):  # noqa: N818
+    """
+    Raised when a string is not a valid expression.
+    """
 
-        expr_list = pp.delimitedList(pp.Group(expr))
+    def __init__(self, msg: str, loc: int) -> None:
+        super().__init__(f"{msg} (at char {loc})")
+        self.msg = msg
+        self.loc = loc
 
-        def insert_fn_argcount_tuple(t: tuple) -> None:
-            fn = t.pop(0)
-            num_args = len(t[0])
-            t.insert(0, (fn, num_args))
 
-        fn_call = (fn_ident + lpar - pp.Group(expr_list) + rpar).setParseAction(insert_fn_argcount_tuple)
+class ExpressionParser:
+    """
+    An expression parser for mathematical expressions. For valid expressions,
+    please see :class:`bpx.Function`.
 
-        atom = (
-            addop[...] + ((fn_call | fnumber | ident).set_parse_action(self.push_first) | pp.Group(lpar + expr + rpar))
-        ).set_parse_action(self.push_unary_minus)
+    After a successful call to :meth:`parse_string`, ``expr_stack`` holds the
+    expression in reverse Polish notation: numbers, the variable ``"x"``,
+    binary operators, ``"unary -"`` and ``(function name, number of arguments)``
+    tuples.
+    """
 
-        # by defining exponentiation as "atom [ ^ factor ]..." instead of "atom
-        # [ ^ atom ]...", we get right-to-left exponents, instead of
-        # left-to-right that is, 2^3^2 = 2^(3^2), not (2^3)^2.
-        factor = pp.Forward()
-        factor <<= atom + (expop + factor).set_parse_action(self.push_first)[...]
-        term = factor + (multop + factor).set_parse_action(self.push_first)[...]
-        expr <<= term + (addop + term).set_parse_action(self.push_first)[...]
+    ParseException = ParseException
 
+    def __init__(self) -> None:
         self.expr_stack = []
-        self.parser = expr
-
-    def push_first(self, toks: tuple) -> None:
-        self.expr_stack.append(toks[0])
-
-    def push_unary_minus(self, toks: tuple) -> None:
-        for t in toks:
-            if t == "-":
-                self.expr_stack.append("unary -")
-            else:
-                break
-
-    def parse_string(self, model_str: str, *, parse_all: bool = True) -> None:
+        self._tokens = []
+        self._pos = 0
+
+    def parse_string(self, model_str: str, *, parse_all: bool = True) -> list:
+        """
+        Parse an expression, raising :class:`ParseException` if it is not valid.
+        Returns a copy of the resulting expression stack.
+        """
         self.expr_stack = []
-        self.parser.parseString(model_str, parseAll=parse_all)
+        self._tokens = self._tokenize(model_str)
+        self._pos = 0
+        self._parse_expr()
+        if parse_all and self._peek()[0] != "end":
+            self._error("Expected end of text")
+        return self.expr_stack[:]
+
+    @staticmethod
+    def _tokenize(model_str: str) -> list[tuple[str, str, int]]:
+        tokens = []
+        pos = 0
+        while True:
+            match = _TOKEN_RE.match(model_str, pos)
+            if match is None:
+                # unrecognised character, parsing stops here
+                loc = len(model_str) - len(model_str[pos:].lstrip(" \t\r\n"))
+                tokens.append(("invalid", model_str[loc], loc))
+                return tokens
+            kind = match.lastgroup
+            tokens.append((kind, match.group(kind), match.start(kind)))
+            if kind == "end":
+                return tokens
+            pos = match.end()
+
+    def _peek(self, offset: int = 0) -> tuple[str, str, int]:
+        return self._tokens[min(self._pos + offset, len(self._tokens) - 1)]
+
+    def _next(self) -> tuple[str, str, int]:
+        token = self._tokens[self._pos]
+        self._pos += 1
+        return token
+
+    def _accept(self, *ops: str) -> str | None:
+        kind, text, _ = self._peek()
+        if kind == "op" and text in ops:
+            self._pos += 1
+            return text
+        return None
+
+    def _expect(self, op: str) -> None:
+        if self._accept(op) is None:
+            self._error(f"Expected {op!r}")
+
+    def _error(self, msg: str) -> None:
+        kind, text, loc = self._peek()
+        found = "end of text" if kind == "end" else repr(text)
+        error_msg = f"{msg}, found {found}"
+        raise ParseException(error_msg, loc)
+
+    def _parse_expr(self) -> None:
+        self._parse_term()
+        while (op := self._accept("+", "-")) is not None:
+            self._parse_term()
+            self.expr_stack.append(op)
+
+    def _parse_term(self) -> None:
+        self._parse_unary()
+        while (op := self._accept("*", "/")) is not None:
+            self._parse_unary()
+            self.expr_stack.append(op)
+
+    def _parse_unary(self) -> None:
+        # as in Python, a sign binds less tightly than a power on its right,
+        # i.e. -x**2 = -(x**2), and more tightly than a power on its left
+        sign = self._accept("+", "-")
+        if sign is None:
+            self._parse_factor()
+            return
+        self._parse_unary()
+        if sign == "-":
+            self.expr_stack.append("unary -")
+
+    def _parse_factor(self) -> None:
+        # by defining exponentiation as "atom [ ** unary ]" instead of "atom
+        # [ ** atom ]...", we get right-to-left exponents, instead of
+        # left-to-right that is, 2**3**2 = 2**(3**2), not (2**3)**2.
+        self._parse_atom()
+        if self._accept("**") is not None:
+            self._parse_unary()
+            self.expr_stack.append("**")
+
+    def _parse_atom(self) -> None:
+        kind, text, _ = self._peek()
+        if kind == "ident" and self._peek(1)[:2] == ("op", "("):
+            self._pos += 2
+            self._parse_expr()
+            num_args = 1
+            while self._accept(",") is not None:
+                self._parse_expr()
+                num_args += 1
+            self._expect(")")
+            self.expr_stack.append((text, num_args))
+        elif kind == "number":
+            self._next()
+            self.expr_stack.append(int(text) if text.isdigit() else float(text))
+        elif kind == "ident" and text == "x":
+            self._next()
+            self.expr_stack.append(text)
+        elif self._accept("(") is not None:
+            self._parse_expr()
+            self._expect(")")
+        else:
+            self._error("Expected a number, 'x', a function call or '('")
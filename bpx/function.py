@@ -1,13 +1,14 @@
 from __future__ import annotations
 
-import copy
-import tempfile
-from importlib import util
+import math
+import operator
+import re
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 from pydantic_core import CoreSchema, core_schema
 
-from bpx import ExpressionParser
+from .expression_parser import ExpressionParser
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -15,6 +16,67 @@ if TYPE_CHECKING:
     from pydantic import GetCoreSchemaHandler, GetJsonSchemaHandler
 
 
+# Constants, "x" and "a * x + b" are accepted without running the parser
+_TRIVIAL_EXPRESSION_RE = re.compile(
+    r"-?(?:\d+\.?\d*(?:[eE][-+]?\d+)?|x)|-?\d+\.?\d*[ \t]*\*[ \t]*x(?:[ \t]*[-+][ \t]*\d+\.?\d*)?",
+)
+
+
+@lru_cache(maxsize=1024)
+def _validated_function(cls: type[Function], expression: str) -> Function:
+    """
+    Parse an expression and return it as an instance of `cls`, raising a ValueError
+    if it is not valid. Valid expressions are cached, so that identical expressions
+    are parsed once and share a single instance.
+
+    A new parser is used for each expression, as parsers hold the state of the
+    expression being parsed and may not be shared between threads.
+    """
+    if not _TRIVIAL_EXPRESSION_RE.fullmatch(expression.strip(" \t\r\n")):
+        try:
+            ExpressionParser().parse_string(expression)
+        except ExpressionParser.ParseException as e:
+            raise ValueError(str(e)) from e
+    return cls(expression)
+
+
+_BINARY_OPERATORS = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.truediv,
+    "**": operator.pow,
+}
+
+# Functions available when evaluating without a preamble, see Function.__call__
+_MATH_FUNCTIONS = {
+    "exp": math.exp,
+    "tanh": math.tanh,
+    "cosh": math.cosh,
+}
+
+
+@lru_cache(maxsize=1024)
+def _rpn(expression: str) -> tuple:
+    """
+    Return the expression in reverse Polish notation, using a new parser so that
+    it is safe to call from several threads. Results are cached by expression.
+    """
+    return tuple(ExpressionParser().parse_string(expression))
+
+
+@lru_cache(maxsize=512)
+def _compile_function(source_code: str, function_name: str) -> Callable:
+    """
+    Compile and execute the source code of a reconstructed function in memory,
+    returning the function object. Results are cached by source code.
+    """
+    code = compile(source_code, f"<bpx:{function_name}>", "exec")
+    namespace = {}
+    exec(code, namespace)  # noqa: S102
+    return namespace[function_name]
+
+
 class Function(str):
     """
     An expression in Python syntax. Only contains:
@@ -26,6 +88,9 @@ class Function(str):
 
     __slots__ = ()
 
+    # Kept for backward compatibility only and no longer used by bpx. A parser holds
+    # the state of the expression being parsed, so this shared instance is not
+    # thread-safe; create an `ExpressionParser()` for each parse instead.
     parser = ExpressionParser()
     default_preamble = "from math import exp, tanh, cosh"
 
@@ -44,11 +109,9 @@ class Function(str):
         if not isinstance(v, str):
             error_msg = "string required"
             raise TypeError(error_msg)
-        try:
-            cls.parser.parse_string(v)
-        except ExpressionParser.ParseException as e:
-            raise ValueError(str(e)) from e
-        return cls(v)
+        # Function instances are not parsed when created, so they are validated too;
+        # instances that were returned by validation come back from the cache
+        return _validated_function(cls, str(v))
 
     @classmethod
     def __get_pydantic_core_schema__(
@@ -56,14 +119,55 @@ class Function(str):
         source_type: str,
         handler: GetCoreSchemaHandler,
     ) -> CoreSchema:
-        return core_schema.no_info_after_validator_function(
-            cls.validate,
+        return core_schema.no_info_wrap_validator_function(
+            cls._validate_or_reuse,
             handler(str),
         )
 
+    @classmethod
+    def _validate_or_reuse(cls, v: Any, handler: core_schema.ValidatorFunctionWrapHandler) -> Function:  # noqa: ANN401
+        # instances of Function skip the str validator; validated expressions are
+        # cached, so reusing them costs a lookup rather than a parse
+        if isinstance(v, cls):
+            return cls.validate(v)
+        return cls.validate(handler(v))
+
     def __repr__(self) -> str:
         return f"Function({super().__repr__()})"
 
+    def __call__(self, x: float) -> float:
+        """
+        Evaluate the expression at 'x' by interpreting its reverse Polish form,
+        without generating any Python code. Only the functions imported by the
+        default preamble (exp, tanh, cosh) are available; use
+        :meth:`to_python_function` for anything else.
+
+        Parameters
+        ----------
+            x: float
+                The value of the variable 'x'
+        """
+        stack = []
+        for item in _rpn(self):
+            if isinstance(item, tuple):
+                name, num_args = item
+                if name not in _MATH_FUNCTIONS:
+                    error_msg = f"Function '{name}' is not supported"
+                    raise ValueError(error_msg)
+                args = stack[-num_args:]
+                del stack[-num_args:]
+                stack.append(_MATH_FUNCTIONS[name](*args))
+            elif item == "x":
+                stack.append(x)
+            elif item == "unary -":
+                stack.append(-stack.pop())
+            elif item in _BINARY_OPERATORS:
+                rhs = stack.pop()
+                stack.append(_BINARY_OPERATORS[item](stack.pop(), rhs))
+            else:
+                stack.append(item)
+        return stack[0]
+
     def to_python_function(self, preamble: str | None = None) -> Callable:
         """
         Return a python function that can be called with a single argument 'x'
@@ -76,7 +180,7 @@ class Function(str):
                 helper functions.
         """
         if preamble is None:
-            preamble = copy.copy(self.default_preamble)
+            preamble = self.default_preamble
         preamble += "\n\n"
         arg_names = ["x"]
         arg_str = ",".join(arg_names)
@@ -85,11 +189,4 @@ class Function(str):
         function_body = f"  return {self}"
         source_code = preamble + function_def + function_body
 
-        with tempfile.NamedTemporaryFile(suffix=f"{function_name}.py", delete=False) as tmp:
-            tmp.write(source_code.encode())
-            tmp.flush()
-            spec = util.spec_from_file_location("tmp", tmp.name)
-            module = util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-
-        return getattr(module, function_name)
+        return _compile_function(source_code, function_name)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from pydantic import BaseModel, ValidationInfo, field_validator
+from pydantic import BaseModel, model_validator
 
 
 class InterpolatedTable(BaseModel):
@@ -12,10 +12,9 @@ class InterpolatedTable(BaseModel):
     x: list[float]
     y: list[float]
 
-    @field_validator("y")
-    @classmethod
-    def same_length(cls, v: list, info: ValidationInfo) -> list:
-        if "x" in info.data and len(v) != len(info.data["x"]):
+    @model_validator(mode="after")
+    def same_length(self) -> InterpolatedTable:
+        if len(self.x) != len(self.y):
             error_msg = "x & y should be same length"
             raise ValueError(error_msg)
-        return v
+        return self
@@ -1,11 +1,18 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
 from .schema import BPX
 
 
+def _validation_context(v_tol: float) -> dict:
+    if v_tol < 0:
+        error_msg = "v_tol should not be negative"
+        raise ValueError(error_msg)
+
+    return {"v_tol": v_tol}
+
+
 def parse_bpx_obj(bpx: dict, v_tol: float = 0.001) -> BPX:
     """
     A convenience function to parse a bpx dict into a BPX model.
@@ -22,13 +29,9 @@ def parse_bpx_obj(bpx: dict, v_tol: float = 0.001) -> BPX:
     BPX: :class:`bpx.BPX`
         a parsed BPX model
     """
-    if v_tol < 0:
-        error_msg = "v_tol should not be negative"
-        raise ValueError(error_msg)
-
-    BPX.Settings.tolerances["Voltage [V]"] = v_tol
+    context = _validation_context(v_tol)
 
-    return BPX.model_validate(bpx)
+    return BPX.model_validate(bpx, context=context)
 
 
 def parse_bpx_file(filename: str | Path, v_tol: float = 0.001) -> BPX:
@@ -50,13 +53,15 @@ def parse_bpx_file(filename: str | Path, v_tol: float = 0.001) -> BPX:
     if str(filename).endswith((".yml", ".yaml")):
         import yaml
 
+        # The LibYAML-based loader is only available if PyYAML was built with it
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
         with Path(filename).open(encoding="utf-8") as f:
-            bpx = yaml.safe_load(f)
-    else:
-        with Path(filename).open(encoding="utf-8") as f:
-            bpx = json.loads(f.read())
+            bpx = yaml.load(f, Loader=loader)  # noqa: S506 (always a safe loader)
+        return parse_bpx_obj(bpx, v_tol)
+
+    context = _validation_context(v_tol)
 
-    return parse_bpx_obj(bpx, v_tol)
+    return BPX.model_validate_json(Path(filename).read_bytes(), context=context)
 
 
 def parse_bpx_str(bpx: str, v_tol: float = 0.001) -> BPX:
@@ -76,5 +81,6 @@ def parse_bpx_str(bpx: str, v_tol: float = 0.001) -> BPX:
     BPX:
         a parsed BPX model
     """
-    bpx = json.loads(bpx)
-    return parse_bpx_obj(bpx, v_tol)
+    context = _validation_context(v_tol)
+
+    return BPX.model_validate_json(bpx, context=context)
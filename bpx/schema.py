@@ -1,16 +1,36 @@
 from __future__ import annotations
 
-from typing import Literal, Union, get_args
+from typing import Annotated, Any, Literal, Union
 from warnings import warn
 
-from pydantic import BaseModel, ConfigDict, Field, model_validator, root_validator
-
-from bpx import Function, InterpolatedTable
+from pydantic import BaseModel, ConfigDict, Discriminator, Field, Tag, ValidationInfo, model_validator
 
 from .base_extra_model import ExtraBaseModel
+from .function import Function
+from .interpolated_table import InterpolatedTable
 from .validators import check_sto_limits
 
-FloatFunctionTable = Union[float, Function, InterpolatedTable]
+
+def _float_function_table_tag(v: Any) -> str:  # noqa: ANN401
+    """
+    Tag strings as functions and dicts as tables; anything else is validated as a float
+    """
+    if isinstance(v, (str, Function)):
+        return "function"
+    if isinstance(v, (dict, InterpolatedTable)):
+        return "table"
+    return "float"
+
+
+FloatFunctionTable = Annotated[
+    Union[
+        Annotated[float, Tag("float")],
+        Annotated[Function, Tag("function")],
+        Annotated[InterpolatedTable, Tag("table")],
+    ],
+    Discriminator(_float_function_table_tag),
+]
+_FLOAT_FUNCTION_TABLE_TYPES = (float, Function, InterpolatedTable)
 
 
 class Header(ExtraBaseModel):
@@ -304,29 +324,50 @@ class ElectrodeBlendedSPM(ContactBase):
     particle: dict[str, Particle] = Field(alias="Particle")
 
 
+def _electrode_tag(v: Any) -> str:  # noqa: ANN401
+    """
+    Tag an electrode as blended if it has a "Particle" entry and as single otherwise,
+    so that only the matching model is tried during validation
+    """
+    if isinstance(v, dict):
+        return "blended" if "Particle" in v else "single"
+    return "blended" if hasattr(v, "particle") else "single"
+
+
+ElectrodeUnion = Annotated[
+    Union[Annotated[ElectrodeSingle, Tag("single")], Annotated[ElectrodeBlended, Tag("blended")]],
+    Discriminator(_electrode_tag),
+]
+ElectrodeSPMUnion = Annotated[
+    Union[Annotated[ElectrodeSingleSPM, Tag("single")], Annotated[ElectrodeBlendedSPM, Tag("blended")]],
+    Discriminator(_electrode_tag),
+]
+
+
 class UserDefined(BaseModel):
     model_config = ConfigDict(extra="allow")
 
-    def __init__(self, **data: dict) -> None:
-        """
-        Overwrite the default __init__ to convert strings to Function objects and
-        dicts to InterpolatedTable objects
-        """
-        for k, v in data.items():
-            if isinstance(v, str):
-                data[k] = Function(v)
-            elif isinstance(v, dict):
-                data[k] = InterpolatedTable(**v)
-        super().__init__(**data)
-
     @model_validator(mode="before")
     @classmethod
     def validate_extra_fields(cls, values: dict) -> dict:
+        """
+        Convert strings to Function objects and dicts to InterpolatedTable objects,
+        and check that every field is then a FloatFunctionTable
+        """
+        if not isinstance(values, dict):
+            return values
+        fields = {}
         for k, v in values.items():
-            if not isinstance(v, get_args(FloatFunctionTable)):
+            if isinstance(v, str):
+                fields[k] = Function.validate(v)
+            elif isinstance(v, dict):
+                fields[k] = InterpolatedTable.model_validate(v)
+            elif isinstance(v, _FLOAT_FUNCTION_TABLE_TYPES):
+                fields[k] = v
+            else:
                 error_msg = f"{k} must be of type 'FloatFunctionTable'"
                 raise TypeError(error_msg)
-        return values
+        return fields
 
 
 class Experiment(ExtraBaseModel):
@@ -369,10 +410,10 @@ class Parameterisation(ExtraBaseModel):
     electrolyte: Electrolyte = Field(
         alias="Electrolyte",
     )
-    negative_electrode: Union[ElectrodeSingle, ElectrodeBlended] = Field(
+    negative_electrode: ElectrodeUnion = Field(
         alias="Negative electrode",
     )
-    positive_electrode: Union[ElectrodeSingle, ElectrodeBlended] = Field(
+    positive_electrode: ElectrodeUnion = Field(
         alias="Positive electrode",
     )
     separator: Contact = Field(
@@ -382,7 +423,10 @@ class Parameterisation(ExtraBaseModel):
         None,
         alias="User-defined",
     )
-    _sto_limit_validation = root_validator(skip_on_failure=True, allow_reuse=True)(check_sto_limits)
+
+    @model_validator(mode="after")
+    def _sto_limit_validation(self, info: ValidationInfo) -> Parameterisation:
+        return check_sto_limits(self, info)
 
 
 class ParameterisationSPM(ExtraBaseModel):
@@ -395,17 +439,45 @@ class ParameterisationSPM(ExtraBaseModel):
     cell: Cell = Field(
         alias="Cell",
     )
-    negative_electrode: Union[ElectrodeSingleSPM, ElectrodeBlendedSPM] = Field(
+    negative_electrode: ElectrodeSPMUnion = Field(
         alias="Negative electrode",
     )
-    positive_electrode: Union[ElectrodeSingleSPM, ElectrodeBlendedSPM] = Field(
+    positive_electrode: ElectrodeSPMUnion = Field(
         alias="Positive electrode",
     )
     user_defined: UserDefined = Field(
         None,
         alias="User-defined",
     )
-    _sto_limit_validation = root_validator(skip_on_failure=True, allow_reuse=True)(check_sto_limits)
+
+    @model_validator(mode="after")
+    def _sto_limit_validation(self, info: ValidationInfo) -> ParameterisationSPM:
+        return check_sto_limits(self, info)
+
+
+# Parameterisation class and model type pairs accepted by BPX.model_based_validation
+_ALLOWED_MODEL_COMBINATIONS = frozenset(
+    {
+        ("Parameterisation", "DFN"),
+        ("Parameterisation", "SPMe"),
+        ("ParameterisationSPM", "SPM"),
+    },
+)
+
+
+def _parameterisation_tag(v: Any) -> str:  # noqa: ANN401
+    """
+    Tag a parameterisation as SPM unless it has an electrolyte or separator
+    """
+    if isinstance(v, dict):
+        return "full" if "Electrolyte" in v or "Separator" in v else "spm"
+    return "full" if hasattr(v, "electrolyte") else "spm"
+
+
+ParameterisationUnion = Annotated[
+    Union[Annotated[ParameterisationSPM, Tag("spm")], Annotated[Parameterisation, Tag("full")]],
+    Discriminator(_parameterisation_tag),
+]
 
 
 class BPX(ExtraBaseModel):
@@ -417,22 +489,16 @@ class BPX(ExtraBaseModel):
     header: Header = Field(
         alias="Header",
     )
-    parameterisation: Union[ParameterisationSPM, Parameterisation] = Field(alias="Parameterisation")
+    parameterisation: ParameterisationUnion = Field(alias="Parameterisation")
     validation: dict[str, Experiment] = Field(None, alias="Validation")
 
-    @root_validator(skip_on_failure=True)
-    @classmethod
-    def model_based_validation(cls, values: dict) -> dict:
-        model = values.get("header").model
-        parameter_class_name = values.get("parameterisation").__class__.__name__
-        allowed_combinations = [
-            ("Parameterisation", "DFN"),
-            ("Parameterisation", "SPMe"),
-            ("ParameterisationSPM", "SPM"),
-        ]
-        if (parameter_class_name, model) not in allowed_combinations:
+    @model_validator(mode="after")
+    def model_based_validation(self) -> BPX:
+        model = self.header.model
+        parameter_class_name = type(self.parameterisation).__name__
+        if (parameter_class_name, model) not in _ALLOWED_MODEL_COMBINATIONS:
             warn(
                 f"The model type {model} does not correspond to the parameter set",
                 stacklevel=2,
             )
-        return values
+        return self
@@ -1,6 +1,6 @@
 from warnings import warn
 
-from bpx import BPX
+from .schema import BPX
 
 
 def get_electrode_stoichiometries(target_soc: float, bpx: BPX) -> tuple[float, float]:
@@ -1,32 +1,51 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 from warnings import warn
 
-from .base_extra_model import ExtraBaseModel
+from .function import Function
+
+if TYPE_CHECKING:
+    from pydantic import ValidationInfo
+
+    from .base_extra_model import ExtraBaseModel
 
 
-def check_sto_limits(cls: ExtraBaseModel, values: dict) -> dict:
+def check_sto_limits(model: ExtraBaseModel, info: ValidationInfo | None = None) -> ExtraBaseModel:
     """
     Validates that the STO limits subbed into the OCPs give the correct voltage limits.
     Works if both OCPs are defined as functions.
     Blended electrodes are not supported.
     This is a reusable validator to be used for both DFN/SPMe and SPM parameter sets.
+
+    The absolute voltage tolerance is read from the "v_tol" entry of the validation
+    context, if given, and otherwise from `Settings.tolerances["Voltage [V]"]`. The
+    check is skipped if the context sets "check_sto_limits" to False.
     """
 
-    try:
-        ocp_n = values.get("negative_electrode").ocp.to_python_function()
-        ocp_p = values.get("positive_electrode").ocp.to_python_function()
-    except AttributeError:
-        # OCPs defined as interpolated tables or one of the electrodes is blended; do nothing
-        return values
+    if info is not None and info.context is not None and not info.context.get("check_sto_limits", True):
+        return model
+
+    ocp_n = getattr(model.negative_electrode, "ocp", None)
+    ocp_p = getattr(model.positive_electrode, "ocp", None)
+    if not (isinstance(ocp_n, Function) and isinstance(ocp_p, Function)):
+        # OCPs defined as constants or interpolated tables or one of the electrodes is
+        # blended; do nothing
+        return model
+    ocp_n = ocp_n.to_python_function()
+    ocp_p = ocp_p.to_python_function()
 
-    sto_n_min = values.get("negative_electrode").minimum_stoichiometry
-    sto_n_max = values.get("negative_electrode").maximum_stoichiometry
-    sto_p_min = values.get("positive_electrode").minimum_stoichiometry
-    sto_p_max = values.get("positive_electrode").maximum_stoichiometry
-    v_min = values.get("cell").lower_voltage_cutoff
-    v_max = values.get("cell").upper_voltage_cutoff
+    sto_n_min = model.negative_electrode.minimum_stoichiometry
+    sto_n_max = model.negative_electrode.maximum_stoichiometry
+    sto_p_min = model.positive_electrode.minimum_stoichiometry
+    sto_p_max = model.positive_electrode.maximum_stoichiometry
+    v_min = model.cell.lower_voltage_cutoff
+    v_max = model.cell.upper_voltage_cutoff
 
-    # Voltage tolerance from `settings` data class
-    tol = cls.Settings.tolerances["Voltage [V]"]
+    # Voltage tolerance from the validation context or the `settings` data class
+    tol = model.Settings.tolerances["Voltage [V]"]
+    if info is not None and info.context is not None:
+        tol = info.context.get("v_tol", tol)
 
     # Checks the maximum voltage estimated from STO
     v_max_sto = ocp_p(sto_p_min) - ocp_n(sto_n_max)
@@ -48,5 +67,4 @@ def check_sto_limits(cls: ExtraBaseModel, values: dict) -> dict:
             stacklevel=2,
         )
 
-    return values
-
+    return model
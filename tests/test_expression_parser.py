@@ -0,0 +1,50 @@
+import unittest
+
+import pytest
+
+from bpx import ExpressionParser
+
+
+class TestExpressionParser(unittest.TestCase):
+    def setUp(self) -> None:
+        self.parser = ExpressionParser()
+
+    def test_precedence(self) -> None:
+        self.parser.parse_string("3 * (x + 1) / 2 - x ** 2")
+        assert self.parser.expr_stack == [3, "x", 1, "+", "*", 2, "/", "x", 2, "**", "-"]
+
+    def test_right_associative_power(self) -> None:
+        self.parser.parse_string("2 ** 3 ** 2")
+        assert self.parser.expr_stack == [2, 3, 2, "**", "**"]
+
+    def test_unary_minus(self) -> None:
+        self.parser.parse_string("2 * --x - -1")
+        assert self.parser.expr_stack == [2, "x", "unary -", "unary -", "*", 1, "unary -", "-"]
+
+    def test_unary_minus_precedence(self) -> None:
+        assert self.parser.parse_string("-x ** 2") == ["x", 2, "**", "unary -"]
+        assert self.parser.parse_string("2 ** -x") == [2, "x", "unary -", "**"]
+        assert self.parser.parse_string("+-x") == ["x", "unary -"]
+
+    def test_numbers(self) -> None:
+        self.parser.parse_string("1 + 2.5 + .5 + 1e3 + 1.5E-3")
+        assert self.parser.expr_stack == [1, 2.5, "+", 0.5, "+", 1e3, "+", 1.5e-3, "+"]
+
+    def test_function_call(self) -> None:
+        self.parser.parse_string("exp(x) * f(x, 2)")
+        assert self.parser.expr_stack == ["x", ("exp", 1), "x", 2, ("f", 2), "*"]
+
+    def test_parse_all(self) -> None:
+        with pytest.raises(ExpressionParser.ParseException, match="Expected end of text"):
+            self.parser.parse_string("x y")
+        self.parser.parse_string("x y", parse_all=False)
+        assert self.parser.expr_stack == ["x"]
+
+    def test_bad_expressions(self) -> None:
+        for expr in ["", "1 +", "xy", "exp x", "f()", "exp(x", "(x))", "1 / / 2", "x $", "2x"]:
+            with pytest.raises(ExpressionParser.ParseException):
+                self.parser.parse_string(expr)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+import subprocess
+import sys
+import unittest
+
+import bpx
+
+
+class TestInit(unittest.TestCase):
+    def run_fresh(self, code: str) -> str:
+        # Run in a new interpreter, so that no bpx submodule has been imported yet
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", code],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+        return result.stdout.strip()
+
+    def test_submodule_access(self) -> None:
+        assert self.run_fresh("import bpx; print(bpx.schema.ElectrodeBlended.__name__)") == "ElectrodeBlended"
+        assert self.run_fresh("import bpx; print(bpx.validators.check_sto_limits.__name__)") == "check_sto_limits"
+
+    def test_lazy_import(self) -> None:
+        assert self.run_fresh("import sys, bpx; print('bpx.schema' in sys.modules)") == "False"
+
+    def test_dir(self) -> None:
+        names = dir(bpx)
+        for name in [*bpx.__all__, "__version__", "schema", "parsers", "function", "validators"]:
+            assert name in names
+        for name in ["TYPE_CHECKING", "_SUBMODULES", "annotations", "import_module"]:
+            assert name not in names
+
+
+if __name__ == "__main__":
+    unittest.main()
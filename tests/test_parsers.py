@@ -1,10 +1,12 @@
 import copy
 import unittest
 import warnings
+from pathlib import Path
 
 import pytest
+from pydantic import ValidationError
 
-from bpx import parse_bpx_file, parse_bpx_obj, parse_bpx_str
+from bpx import BPX, parse_bpx_file, parse_bpx_obj, parse_bpx_str
 
 
 class TestParsers(unittest.TestCase):
@@ -127,7 +129,29 @@ class TestParsers(unittest.TestCase):
         with pytest.warns(UserWarning):
             parse_bpx_str(test)
 
+    def test_parse_file(self) -> None:
+        test = copy.copy(self.base)
+        Path("base.json").write_text(test)
+        with pytest.warns(UserWarning, match="The maximum voltage computed from the STO limits"):
+            bpx = parse_bpx_file("base.json")
+        assert bpx.parameterisation.cell.electrode_area == 0.016808
+
+    def test_parse_yaml_file(self) -> None:
+        test = copy.copy(self.base)
+        Path("base.yaml").write_text(test)
+        with pytest.warns(UserWarning, match="The maximum voltage computed from the STO limits"):
+            bpx = parse_bpx_file("base.yaml")
+        assert bpx.parameterisation.cell.electrode_area == 0.016808
+
+    def test_parse_invalid_json(self) -> None:
+        with pytest.raises(ValidationError, match="json_invalid"):
+            parse_bpx_str('{"Header": {"BPX": 1.0,}')
+        Path("invalid.json").write_text('{"Header": ')
+        with pytest.raises(ValidationError, match="json_invalid"):
+            parse_bpx_file("invalid.json")
+
     def test_parse_string_tolerance(self) -> None:
         warnings.filterwarnings("error")  # Treat warnings as errors
         test = copy.copy(self.base)
         parse_bpx_str(test, v_tol=0.002)
+        assert BPX.Settings.tolerances["Voltage [V]"] == 0.001
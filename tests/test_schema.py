@@ -1,12 +1,16 @@
 import copy
+import math
+import sys
 import unittest
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
+from unittest import mock
 
 import pytest
 from pydantic import TypeAdapter, ValidationError
 
-from bpx import BPX
+from bpx import BPX, ExpressionParser, Function
 
 adapter = TypeAdapter(BPX)
 
@@ -246,6 +250,21 @@ class TestSchema(unittest.TestCase):
         ):
             adapter.validate_python(test)
 
+    def test_parameterisation_tagged_union(self) -> None:
+        test = copy.deepcopy(self.base)
+        del test["Parameterisation"]["Electrolyte"]
+        with pytest.raises(ValidationError) as excinfo:
+            adapter.validate_python(test)
+        errors = excinfo.value.errors()
+        assert len(errors) == 1
+        assert errors[0]["loc"] == ("Parameterisation", "full", "Electrolyte")
+
+    def test_parameterisation_instance(self) -> None:
+        for base in [self.base, self.base_spm]:
+            obj = adapter.validate_python(copy.deepcopy(base))
+            test = {"Header": base["Header"], "Parameterisation": obj.parameterisation}
+            assert adapter.validate_python(test).parameterisation == obj.parameterisation
+
     def test_table(self) -> None:
         test = copy.deepcopy(self.base)
         test["Parameterisation"]["Electrolyte"]["Conductivity [S.m-1]"] = {
@@ -276,11 +295,38 @@ class TestSchema(unittest.TestCase):
         test["Parameterisation"]["Electrolyte"]["Conductivity [S.m-1]"] = "1.0 * exp(x) + 3"
         adapter.validate_python(test)
 
+    def test_function_shared_instance(self) -> None:
+        test = copy.deepcopy(self.base)
+        test["Parameterisation"]["Electrolyte"]["Conductivity [S.m-1]"] = "1.0 * exp(x) + 3"
+        test["Parameterisation"]["Electrolyte"]["Diffusivity [m2.s-1]"] = "1.0 * exp(x) + 3"
+        obj = adapter.validate_python(test)
+        electrolyte = obj.parameterisation.electrolyte
+        assert electrolyte.conductivity is electrolyte.diffusivity
+
+    def test_function_instance(self) -> None:
+        test = copy.deepcopy(self.base)
+        for funct in [Function("this is not a function"), Function("__import__('sys') or x")]:
+            test["Parameterisation"]["Electrolyte"]["Conductivity [S.m-1]"] = funct
+            with pytest.raises(ValidationError):
+                adapter.validate_python(test)
+
+    def test_validated_function_instance(self) -> None:
+        test = copy.deepcopy(self.base)
+        test["Parameterisation"]["Electrolyte"]["Conductivity [S.m-1]"] = "2.0 * exp(x)"
+        funct = adapter.validate_python(test).parameterisation.electrolyte.conductivity
+        test["Parameterisation"]["Electrolyte"]["Conductivity [S.m-1]"] = funct
+        with mock.patch.object(ExpressionParser, "parse_string", side_effect=AssertionError("reparsed")):
+            obj = adapter.validate_python(test)
+        assert obj.parameterisation.electrolyte.conductivity is funct
+
     def test_bad_function(self) -> None:
         test = copy.deepcopy(self.base)
         test["Parameterisation"]["Electrolyte"]["Conductivity [S.m-1]"] = "this is not a function"
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValidationError) as excinfo:
             adapter.validate_python(test)
+        errors = excinfo.value.errors()
+        assert len(errors) == 1
+        assert errors[0]["loc"][-1] == "function"
 
     def test_to_python_function(self) -> None:
         test = copy.deepcopy(self.base)
@@ -290,6 +336,46 @@ class TestSchema(unittest.TestCase):
         pyfunct = funct.to_python_function()
         assert pyfunct(2.0) == 4.0
 
+    def test_function_call(self) -> None:
+        test = copy.deepcopy(self.base)
+        obj = adapter.validate_python(test)
+        funct = obj.parameterisation.electrolyte.diffusivity
+        assert funct(0.5) == funct.to_python_function()(0.5)
+        funct = Function("-x ** 2 + exp(2 * x) / cosh(x) - tanh(-x)")
+        assert funct(1.5) == pytest.approx(-(1.5**2) + math.exp(3) / math.cosh(1.5) - math.tanh(-1.5))
+        with pytest.raises(ValueError, match="Function 'sin' is not supported"):
+            Function("sin(x)")(1.0)
+
+    def test_function_threads(self) -> None:
+        expressions = [f"{i} * exp(x) - cosh(x / {i + 1}) + tanh({i} * x) ** 2" for i in range(2000)]
+
+        def evaluate(expression: str) -> float:
+            return Function.validate(expression)(0.3)
+
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)  # switch threads often to expose shared state
+        try:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(executor.map(evaluate, expressions))
+        finally:
+            sys.setswitchinterval(switch_interval)
+        for expression, result in zip(expressions, results):
+            assert result == pytest.approx(Function(expression).to_python_function()(0.3))
+
+    def test_to_python_function_cached(self) -> None:
+        test = copy.deepcopy(self.base)
+        obj = adapter.validate_python(test)
+        funct = obj.parameterisation.electrolyte.diffusivity
+        assert funct.to_python_function() is funct.to_python_function()
+        # the preamble is part of the cache key
+        funct = Function("2 * tanh(x)")
+        default = funct.to_python_function()
+        custom = funct.to_python_function(preamble="from math import exp as tanh")
+        assert default is not custom
+        assert default(1.0) == pytest.approx(2 * math.tanh(1.0))
+        assert custom(1.0) == pytest.approx(2 * math.exp(1.0))
+        assert default(1.0) != custom(1.0)
+
     def test_bad_input(self) -> None:
         test = copy.deepcopy(self.base)
         test["Parameterisation"]["Electrolyte"]["bad"] = "this shouldn't be here"
@@ -330,8 +416,14 @@ class TestSchema(unittest.TestCase):
         warnings.filterwarnings("error")  # Treat warnings as errors
         test = copy.deepcopy(self.base_non_blended)
         test["Parameterisation"]["Cell"]["Upper voltage cut-off [V]"] = 4.0
-        BPX.Settings.tolerances["Voltage [V]"] = 0.25
-        adapter.validate_python(test)
+        adapter.validate_python(test, context={"v_tol": 0.25})
+
+    def test_check_sto_limits_validator_disabled(self) -> None:
+        test = copy.deepcopy(self.base_non_blended)
+        test["Parameterisation"]["Cell"]["Upper voltage cut-off [V]"] = 4.0
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            adapter.validate_python(test, context={"check_sto_limits": False})
 
     def test_check_sto_limits_validator_low_voltage(self) -> None:
         test = copy.deepcopy(self.base_non_blended)
@@ -343,8 +435,7 @@ class TestSchema(unittest.TestCase):
         warnings.filterwarnings("error")  # Treat warnings as errors
         test = copy.deepcopy(self.base_non_blended)
         test["Parameterisation"]["Cell"]["Lower voltage cut-off [V]"] = 3.0
-        BPX.Settings.tolerances["Voltage [V]"] = 0.35
-        adapter.validate_python(test)
+        adapter.validate_python(test, context={"v_tol": 0.35})
 
     def test_user_defined(self) -> None:
         test = copy.deepcopy(self.base)
@@ -371,7 +462,22 @@ class TestSchema(unittest.TestCase):
     def test_user_defined_function(self) -> None:
         test = copy.deepcopy(self.base)
         test["Parameterisation"]["User-defined"] = {"a": "2.0 * x"}
-        adapter.validate_python(test)
+        obj = adapter.validate_python(test)
+        assert isinstance(obj.parameterisation.user_defined.a, Function)
+        assert test["Parameterisation"]["User-defined"] == {"a": "2.0 * x"}
+
+    def test_user_defined_function_shared_instance(self) -> None:
+        test = copy.deepcopy(self.base)
+        test["Parameterisation"]["Electrolyte"]["Conductivity [S.m-1]"] = "3.0 * exp(x)"
+        test["Parameterisation"]["User-defined"] = {"a": "3.0 * exp(x)"}
+        obj = adapter.validate_python(test)
+        assert obj.parameterisation.user_defined.a is obj.parameterisation.electrolyte.conductivity
+
+    def test_bad_user_defined_function(self) -> None:
+        test = copy.deepcopy(self.base)
+        test["Parameterisation"]["User-defined"] = {"a": "this is not a function"}
+        with pytest.raises(ValidationError):
+            adapter.validate_python(test)
 
     def test_bad_user_defined(self) -> None:
         test = copy.deepcopy(self.base)